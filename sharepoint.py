@@ -26,8 +26,9 @@ If the configurations for a SharePoint site is already present in ``config.ini``
 >>> site_1.connection_status()
 200
 >>> site1.create_folder('Shared Documents/folder1', 'new_folder')
-Folder creation attempt response: 200
-Folder: new_folder created at Shared Documents/folder1
+
+Progress of uploads, downloads and folder creation is reported through the ``sharepoint`` logger,
+enable it with e.g. ``logging.basicConfig(level=logging.INFO)``.
 
 If you want to register new configurations of internal SharePoint site
 
@@ -45,18 +46,88 @@ domain='telefonicacorp.sharepoint.com', tenant_id='9730...')
 """
 
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
+from email.parser import BytesParser
+from functools import lru_cache
+import json
+import logging
 from pathlib import Path
-from typing import NamedTuple
+from typing import Iterable, NamedTuple
+import time
 from urllib import parse
+import uuid
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 # ConfigParser is used to read/write to 'config.ini' file
 # parse is used to encode the url
 # NamedTuple is used to make the type hinting clear wherever it is used
 
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 64 * 1024
+# Files up to this size are read in one call, larger ones are streamed from the file handle
+_SMALL_UPLOAD_SIZE = 2 * 1024 * 1024
+_CHUNKED_UPLOAD_THRESHOLD = 250 * 1024 * 1024
+_UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+# Kept below the adapter's pool_maxsize so every worker gets a pooled connection
+_MAX_WORKERS = 8
+# SharePoint Online rejects $batch requests with more than 100 operations
+_BATCH_LIMIT = 100
+# Cached access tokens are refreshed this many seconds before they expire
+_TOKEN_EXPIRY_MARGIN = 60
+# Per-call override of the session's JSON Content-Type for file bodies
+_BINARY_HEADERS = {'Content-Type': 'application/octet-stream'}
+
+Configs = namedtuple('Configs', ['TENANT_ID', 'DOMAIN', 'CLIENT_ID', 'CLIENT_SECRET'])
+Response = namedtuple('Response', ['status_code', 'token', 'domain'])
+BatchResponse = namedtuple('BatchResponse', ['status_code', 'content'])
+
+
+def _build_session(pool_maxsize: int = 16) -> requests.Session:
+    # A single session per host keeps TCP/TLS connections alive across calls, and since every session
+    # only ever talks to that one host the adapter needs just one connection pool
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retries))
+    return session
+
+
+# Shared by every builder, so sites on the same tenant reuse connections to the token endpoint
+_TOKEN_SESSION = _build_session(pool_maxsize=4)
+_TOKEN_SESSION.headers.update({'content-type': "application/x-www-form-urlencoded", 'cache-control': "no-cache"})
+
+
+@lru_cache(maxsize=256)
+def _quote_path(path) -> str:
+    # Apostrophes are doubled to escape them inside OData string literals before percent-encoding
+    return parse.quote(str(path).replace("'", "''"), safe="/")
+
+
+def _parse_batch_response(response: requests.Response) -> list:
+    # Each application/http part of the (possibly nested) multipart body holds one raw HTTP response
+    raw = F"Content-Type: {response.headers['Content-Type']}\r\n\r\n".encode('utf-8') + response.content
+    results = []
+    for part in BytesParser().parsebytes(raw).walk():
+        if part.get_content_type() == 'application/http':
+            payload = part.get_payload(decode=True)
+            head, separator, content = payload.partition(b'\r\n\r\n')
+            if not separator:
+                head, _, content = payload.partition(b'\n\n')
+            status_code = int(head.split(None, 2)[1])
+            results.append(BatchResponse(status_code, content.strip()))
+    return results
+
+
 class SharePoint:
     """A class used to represent SharePoint object.
 
@@ -91,6 +162,9 @@ class SharePoint:
         self.access_token = response.token
         self.status_code = response.status_code
         self.domain = response.domain
+        self._site_q = parse.quote(site, safe='')
+        self._base = F"https://{self.domain}/sites/{self._site_q}/_api/web"
+        self._session = _build_session()
         self._set_headers()
 
     def __repr__(self):
@@ -108,15 +182,33 @@ class SharePoint:
         return self.status_code
 
     def _set_headers(self):
-        self.headers = {"Accept": "application/json; odata=verbose",
-                        "Content-Type": "application/json; odata=verbose",
-                        "Authorization": F"Bearer {self.access_token}"}
-        self.json_data = None
+        self._session.headers.update({"Accept": "application/json; odata=verbose",
+                                      "Accept-Encoding": "gzip, deflate",
+                                      "Content-Type": "application/json; odata=verbose",
+                                      "Authorization": F"Bearer {self.access_token}"})
+        self._metadata_cache = {}
 
     def _get_metadata(self, folder_path: str) -> dict:
-        url = F"https://{self.domain}/sites/{self.site}/_api/web/GetFolderByServerRelativeUrl('{folder_path}')/files"
-        data = requests.get(url, headers=self.headers)
-        self.json_data = data.json()
+        if folder_path not in self._metadata_cache:
+            url = F"{self._base}/GetFolderByServerRelativeUrl('{_quote_path(folder_path)}')/files"
+            data = self._session.get(url)
+            results = _json_loads(data.content)['d']['results']
+            self._metadata_cache[folder_path] = {entry['Name']: entry for entry in results}
+        return self._metadata_cache[folder_path]
+
+    def invalidate_metadata(self, folder_path: str = None):
+        """Drops cached folder metadata so the next download fetches it again
+
+        Parameters
+        ----------
+        folder_path : :obj:`str`, optional
+            Folder whose metadata should be refreshed, all folders are refreshed if not specified
+
+        """
+        if folder_path is None:
+            self._metadata_cache.clear()
+        else:
+            self._metadata_cache.pop(folder_path, None)
 
     def download_file(self, folder_path: str, file_name: str, path_to_save: str) -> Path:
         """Downloads file from specified SharePoint folder_path
@@ -145,25 +237,18 @@ class SharePoint:
         Make sure your credentials have adequate permissions before calling the method
 
         """
-        if not self.json_data:
-            self._get_metadata(folder_path)
-        file_name_data = self.json_data['d']['results']
-        for key in file_name_data:
-            if key['Name'] == file_name:
-                url_to_file = F"https://{self.domain}/sites/{self.site}/_api/web/GetFolderByServerRelativeUrl('" \
-                              F"{folder_path}')/Files('{file_name}')/$value"
-                file_save_path = Path(path_to_save).joinpath(file_name)
-                response = requests.get(url_to_file, headers=self.headers)
-                with open(file_save_path, 'wb+') as file:
-                    for chunk in response.iter_content(chunk_size=1024):
-                        if chunk:
-                            file.write(chunk)
-                            file.flush()
-                print(F"\nStatus: {response.status_code}, File: {file_name} downloaded to {file_save_path.parent}")
-                return file_save_path
-        raise FileNotFoundError(F"{file_name} not found at: {folder_path}")
-
-    def bulk_download(self, folder_path: str, path_to_save: str, files: list) -> dict:
+        if file_name not in self._get_metadata(folder_path):
+            raise FileNotFoundError(F"{file_name} not found at: {folder_path}")
+        url_to_file = F"{self._base}/GetFolderByServerRelativeUrl('{_quote_path(folder_path)}')" \
+                      F"/Files('{_quote_path(file_name)}')/$value"
+        file_save_path = Path(path_to_save).joinpath(file_name)
+        with self._session.get(url_to_file, stream=True) as response, open(file_save_path, 'wb') as file:
+            for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                file.write(chunk)
+        logger.info("Status: %s, File: %s downloaded to %s", response.status_code, file_name, file_save_path.parent)
+        return file_save_path
+
+    def bulk_download(self, folder_path: str, path_to_save: str, files: Iterable) -> dict:
         """Downloads multiple files at once
 
         Parameters
@@ -172,20 +257,18 @@ class SharePoint:
             Path where files are located. e.g. ``"Shared Documents/folder1/folder2"``
         path_to_save : str
             Local path where files need to be saved
-        files : list
-            List of file names to be downloaded
+        files : iterable
+            File names to be downloaded, e.g. a list, tuple or generator
 
         Returns
         -------
         dict
             A dictionary with keys as filenames and paths as values
         """
-        if isinstance(files, list):
-            file_paths = [self.download_file(folder_path, _, path_to_save) for _ in files]
-            path_dict = {}
-            for path in file_paths:
-                path_dict[path.stem] = str(path)
-        return path_dict
+        self._get_metadata(folder_path)
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            file_paths = list(executor.map(lambda file: self.download_file(folder_path, file, path_to_save), files))
+        return {path.stem: str(path) for path in file_paths}
 
     def upload_file(self, folder_path, absolute_filepath):
         """Uploads file to specified SharePoint path.
@@ -209,21 +292,55 @@ class SharePoint:
         """
         file_path = Path(absolute_filepath)
         if file_path.is_file():
-            with file_path.open(mode='rb') as file:
-                file_buffer = file.read()
-
-            url = F"https://{self.domain}/sites/{self.site}/_api/web/getfolderbyserverrelativeurl('{folder_path}')/Files" \
-                  F"/add(url='{file_path.name}', overwrite=true)"
+            size = file_path.stat().st_size
+            url = F"{self._base}/getfolderbyserverrelativeurl('{_quote_path(folder_path)}')/Files" \
+                  F"/add(url='{_quote_path(file_path.name)}', overwrite=true)"
 
-            data = requests.post(url, headers=self.headers, data=file_buffer)
+            with file_path.open(mode='rb') as file:
+                headers = {**_BINARY_HEADERS, 'Content-Length': str(size)}
+                if size <= _SMALL_UPLOAD_SIZE:
+                    data = self._session.post(url, data=memoryview(file.read()), headers=headers)
+                elif size <= _CHUNKED_UPLOAD_THRESHOLD:
+                    data = self._session.post(url, data=file, headers=headers)
+                else:
+                    data = self._chunked_upload(url, file)
             if data.status_code == 200:
-                print(F"\nStatus: {data.status_code}, File: {file_path.name} uploaded to {folder_path}")
+                self.invalidate_metadata(folder_path)
+                logger.info("Status: %s, File: %s uploaded to %s", data.status_code, file_path.name, folder_path)
             else:
-                print(F"\nUpload attempt response: {data.status_code}")
-                print(F"\n Upload response content: {data.content}")
+                logger.warning("Upload attempt response: %s, content: %s", data.status_code, data.content)
         else:
             raise FileNotFoundError(F"{file_path.name} not found at: {file_path.parent}")
 
+    def _chunked_upload(self, add_url: str, file) -> requests.Response:
+        # Files above the threshold are sent through SharePoint's StartUpload/ContinueUpload/FinishUpload
+        # endpoints, reading one chunk at a time from the open file
+        response = self._session.post(add_url, headers={'Content-Length': '0'})
+        if response.status_code != 200:
+            return response
+        server_relative_url = _quote_path(_json_loads(response.content)['d']['ServerRelativeUrl'])
+        url = F"{self._base}/GetFileByServerRelativeUrl('{server_relative_url}')"
+        upload_id = uuid.uuid4()
+        offset = 0
+        chunk = file.read(_UPLOAD_CHUNK_SIZE)
+        while True:
+            next_chunk = file.read(_UPLOAD_CHUNK_SIZE)
+            if offset == 0:
+                action = F"StartUpload(uploadId=guid'{upload_id}')"
+            elif next_chunk:
+                action = F"ContinueUpload(uploadId=guid'{upload_id}',fileOffset={offset})"
+            else:
+                action = F"FinishUpload(uploadId=guid'{upload_id}',fileOffset={offset})"
+            response = self._session.post(F"{url}/{action}", data=chunk, headers=_BINARY_HEADERS)
+            if response.status_code != 200:
+                # Release the upload session so the partially written file isn't left locked
+                self._session.post(F"{url}/CancelUpload(uploadId=guid'{upload_id}')", headers={'Content-Length': '0'})
+                return response
+            if not next_chunk:
+                return response
+            offset += len(chunk)
+            chunk = next_chunk
+
     def bulk_upload(self, folder_path: str, files_to_upload: list):
         """Uploads multiple files at once to a specified SharePoint path
 
@@ -235,8 +352,8 @@ class SharePoint:
             List of file names to upload, file names. e.g. ``["C:\folder1\foo.txt", "C:\folder2\bar.xlsx"]``
 
         """
-        for file in files_to_upload:
-            self.upload_file(folder_path, file)
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            list(executor.map(lambda file: self.upload_file(folder_path, file), files_to_upload))
 
     def create_folder(self, folder_path: str, folder_name: str):
         """Creates folder at specified SharePoint path.
@@ -253,16 +370,65 @@ class SharePoint:
         Make sure your credentials have adequate permissions before calling the method
 
         """
-        url = F'https://{self.domain}/sites/{self.site}/_api/web/folders'
+        url = F'{self._base}/folders'
         json = {"__metadata": {"type": "SP.Folder"},
                 "ServerRelativeUrl": F"{folder_path}/{folder_name}"}
-        response = requests.post(url, headers=self.headers, json=json)
+        response = self._session.post(url, json=json)
         if response.status_code == 201:
-            print(F"\nFolder creation attempt response: {response.status_code}")
-            print(F"\nFolder: {folder_name} created at {folder_path}")
+            logger.info("Folder: %s created at %s", folder_name, folder_path)
         else:
-            print(F"\nFolder creation attempt response: {response.status_code}")
-            print(F"\nFolder creation response content: {response.content}")
+            logger.warning("Folder creation attempt response: %s, content: %s", response.status_code, response.content)
+
+    def batch_create_folders(self, folders: list):
+        """Creates multiple folders with a single ``$batch`` request per 100 folders
+
+        Parameters
+        ----------
+        folders : list
+            List of ``(folder_path, folder_name)`` tuples. e.g. ``[("Shared Documents/folder1", "new_folder")]``
+
+        Warnings
+        --------
+        Make sure your credentials have adequate permissions before calling the method
+
+        """
+        url = F'{self._base}/folders'
+        operations = [('POST', url, {"__metadata": {"type": "SP.Folder"},
+                                     "ServerRelativeUrl": F"{folder_path}/{folder_name}"})
+                      for folder_path, folder_name in folders]
+        for (folder_path, folder_name), response in zip(folders, self._batch(operations)):
+            if response.status_code == 201:
+                logger.info("Folder: %s created at %s", folder_name, folder_path)
+            else:
+                logger.warning("Folder creation attempt response: %s, content: %s",
+                               response.status_code, response.content)
+
+    def _batch(self, operations: list) -> list:
+        # Packs (method, url, json_body) operations into OData $batch requests, GETs as plain parts and
+        # writes as one changeset each, and returns a BatchResponse per operation in the same order
+        responses = []
+        for start in range(0, len(operations), _BATCH_LIMIT):
+            boundary = F"batch_{uuid.uuid4()}"
+            lines = []
+            for method, url, body in operations[start:start + _BATCH_LIMIT]:
+                lines.append(F"--{boundary}")
+                request = [F"{method} {url} HTTP/1.1", "Accept: application/json; odata=verbose"]
+                if method == 'GET':
+                    lines += ["Content-Type: application/http", "Content-Transfer-Encoding: binary", ""]
+                    lines += request + [""]
+                    continue
+                changeset = F"changeset_{uuid.uuid4()}"
+                lines += [F'Content-Type: multipart/mixed; boundary="{changeset}"', "", F"--{changeset}",
+                          "Content-Type: application/http", "Content-Transfer-Encoding: binary", ""]
+                lines += request + ["Content-Type: application/json; odata=verbose", "",
+                                    json.dumps(body) if body is not None else "", F"--{changeset}--"]
+            lines += [F"--{boundary}--", ""]
+            url = F"https://{self.domain}/sites/{self._site_q}/_api/$batch"
+            response = self._session.post(url, data="\r\n".join(lines).encode('utf-8'),
+                                          headers={'Content-Type': F'multipart/mixed; boundary="{boundary}"'})
+            response.raise_for_status()
+            responses += _parse_batch_response(response)
+        return responses
 
 
 class SharePointObjectBuilder:
@@ -298,6 +464,9 @@ class SharePointObjectBuilder:
 
     def __init__(self):
         self._instance = None
+        self._token_cache = {}
+        self._parser = None
+        self._parser_mtime = None
 
     def __call__(self, site: str):
         if site:
@@ -320,34 +489,39 @@ class SharePointObjectBuilder:
             raise KeyError(f"Configuration not found for {site}")
 
     def _read_config_file(self):
-        self._parser = ConfigParser()
+        try:
+            mtime = Path('config.ini').stat().st_mtime
+        except FileNotFoundError:
+            raise FileNotFoundError('Configuration file not found') from None
+        if self._parser is not None and mtime == self._parser_mtime:
+            return
+        self._parser = ConfigParser(interpolation=None)
         if self._parser.read('config.ini'):
-            pass
+            self._parser_mtime = mtime
         else:
             raise FileNotFoundError('Configuration file not found')
 
     def _get_configs(self, site: str):
-        _configuration = namedtuple('Configs', ['TENANT_ID', 'DOMAIN', 'CLIENT_ID', 'CLIENT_SECRET'])
-        self._configs = _configuration(self._parser.get(site, 'TENANT_ID'),
-                                       self._parser.get(site, 'DOMAIN'),
-                                       self._parser.get(site, 'CLIENT_ID'),
-                                       self._parser.get(site, 'CLIENT_SECRET'))
+        section = self._parser[site]
+        self._configs = Configs(section['TENANT_ID'], section['DOMAIN'], section['CLIENT_ID'], section['CLIENT_SECRET'])
 
     def _authorize(self, site: str) -> NamedTuple:
         self._get_configs(site)
+        cache_key = (site, self._configs.TENANT_ID, self._configs.CLIENT_ID, self._configs.DOMAIN)
+        cached, expires_at = self._token_cache.get(cache_key, (None, 0))
+        if time.monotonic() < expires_at - _TOKEN_EXPIRY_MARGIN:
+            return cached
         url = F"https://accounts.accesscontrol.windows.net/{self._configs.TENANT_ID}/tokens/OAuth/2"
-        encoded = parse.quote(self._configs.CLIENT_SECRET)
-        payload = F"grant_type=client_credentials&client_id={self._configs.CLIENT_ID}%40{self._configs.TENANT_ID}&" \
-                  F"client_secret={encoded}&resource=00000003-0000-0ff1-ce00-000000000000%2F" \
-                  F"{self._configs.DOMAIN}%40{self._configs.TENANT_ID}"
-        headers = {
-            'content-type': "application/x-www-form-urlencoded",
-            'cache-control': "no-cache",
-            'postman-token': "db08fff1-63bf-1f8d-84c2-4f466cc49afc"
-        }
-        res = requests.request("POST", url, data=payload, headers=headers)
-        response = namedtuple('Response', ['status_code', 'token', 'domain'])
-        return response(res.status_code, res.json().get('access_token'), self._configs.DOMAIN)
+        payload = {"grant_type": "client_credentials",
+                   "client_id": F"{self._configs.CLIENT_ID}@{self._configs.TENANT_ID}",
+                   "client_secret": self._configs.CLIENT_SECRET,
+                   "resource": F"00000003-0000-0ff1-ce00-000000000000/{self._configs.DOMAIN}@{self._configs.TENANT_ID}"}
+        res = _TOKEN_SESSION.post(url, data=payload)
+        token_data = _json_loads(res.content)
+        response = Response(res.status_code, token_data.get('access_token'), self._configs.DOMAIN)
+        if res.status_code == 200:
+            self._token_cache[cache_key] = (response, time.monotonic() + int(token_data.get('expires_in', 0)))
+        return response
 
     def register_site(self, *, site: str, client_id: str, client_secret: str, domain: str = None,
                       tenant_id: str = None):
@@ -384,6 +558,7 @@ class SharePointObjectBuilder:
             self._parser[site].update({'domain': domain, 'tenant_id': tenant_id})
         with open('config.ini', 'w') as file:
             self._parser.write(file)
+        self._parser_mtime = None
         sharepoint_object = self.__call__(site)
         return sharepoint_object
 